@@ -1,4 +1,5 @@
 """Wordplay Solver - Find the highest scoring words from given letters."""
+import threading
 from typing import Dict, Optional, Tuple
 
 __version__ = "0.1.0"
@@ -16,13 +17,17 @@ except ImportError:
     __all__ = ['WordSolver', 'Dictionary', 'calculate_word_score', 
                'get_letter_values', 'load_dictionary', 'find_best_word']
 
+# Default-dictionary solver reused by find_best_word, created on first use
+_DEFAULT_SOLVER: Optional[WordSolver] = None
+_DEFAULT_SOLVER_LOCK = threading.Lock()
+
 # For backward compatibility
 def find_best_word(letters: str, custom_values: Optional[Dict[str, int]] = None) -> Tuple[str, int]:
     """
     Find the highest scoring word from the given letters.
     
-    This is a convenience function that creates a WordSolver instance and calls its method.
-    For better performance with multiple calls, create a WordSolver instance directly.
+    This is a convenience function that lazily creates a shared WordSolver instance
+    on the first call and reuses it afterwards.
     
     Args:
         letters: String of available letters (can include custom values, e.g., 'a1b3')
@@ -31,5 +36,9 @@ def find_best_word(letters: str, custom_values: Optional[Dict[str, int]] = None)
     Returns:
         Tuple of (best_word, score)
     """
-    solver = WordSolver()
-    return solver.find_best_word(letters, custom_values)
+    global _DEFAULT_SOLVER
+    if _DEFAULT_SOLVER is None:
+        with _DEFAULT_SOLVER_LOCK:
+            if _DEFAULT_SOLVER is None:
+                _DEFAULT_SOLVER = WordSolver()
+    return _DEFAULT_SOLVER.find_best_word(letters, custom_values)
@@ -5,7 +5,6 @@ import sys
 from pathlib import Path
 
 from wordplay_solver.solver import WordSolver
-from collections import defaultdict
 
 # Optional screen capture import
 try:
@@ -14,30 +13,25 @@ try:
 except ImportError:
     SCREEN_CAPTURE_AVAILABLE = False
 
-def display_comprehensive_results(word_scores, current_window=None, screen_capture=None):
+def display_comprehensive_results(top_5_scores, top_by_length, current_window=None, screen_capture=None):
     """Display comprehensive word results with top 5 scoring words and top 5 for each letter count."""
-    if not word_scores:
+    if not top_5_scores:
         print("\nNo valid words found with the given letters.\n")
         return
     
     # Display top 5 scoring words overall
     print("\n=== TOP 5 SCORING WORDS ===")
-    top_5_scores = word_scores[:5]
     top_words = [f"{word.upper()}({score})" for word, score, length in top_5_scores]
     print(", ".join(top_words))
     
-    # Group words by length
-    words_by_length = defaultdict(list)
-    for word, score, length in word_scores:
-        if length >= 4:  # Only show 4+ letter words
-            words_by_length[length].append((word, score, length))
+    # Only show 4+ letter words; each bucket already holds its top 5
+    words_by_length = {length: words for length, words in top_by_length.items() if length >= 4}
     
     # Display top 5 words for each letter count (4+ letters)
     if words_by_length:
         print("\n=== TOP WORDS BY LENGTH (4+ LETTERS) ===")
         for length in sorted(words_by_length.keys()):
-            words_for_length = words_by_length[length][:5]  # Top 5 for this length
-            length_words = [f"{word.upper()}({score})" for word, score, _ in words_for_length]
+            length_words = [f"{word.upper()}({score})" for word, score, _ in words_by_length[length]]
             print(f"{length}: {', '.join(length_words)}")
     
     # Word selection and typing interface
@@ -214,11 +208,12 @@ def interactive_loop(solver, custom_values=None, screen_capture=None):
                 # Use the input as letters directly
                 letters = user_input
                 
-            # Find all words with scores
-            word_scores = solver.find_all_words_with_scores(letters, custom_values)
+            # Only the top 5 overall and per length are shown, so skip sorting the full listing
+            top_5_scores = solver.find_top_words_with_scores(letters, custom_values, 5)
+            top_by_length = solver.find_top_words_by_length(letters, custom_values, 5)
             
             # Display comprehensive results
-            display_comprehensive_results(word_scores, current_window, screen_capture)
+            display_comprehensive_results(top_5_scores, top_by_length, current_window, screen_capture)
                 
         except KeyboardInterrupt:
             print("\nGoodbye!")
@@ -0,0 +1,158 @@
+"""Compiled inner loops for the NumPy-backed dictionary index.
+
+Numba is optional: when it is not installed, each kernel falls back to an
+equivalent pure-NumPy implementation.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Dictionaries with at least this many rows are scanned in parallel slices
+PARALLEL_MIN_ROWS = 1 << 20
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Lazily create the shared thread pool used for sharded scans."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _executor
+
+
+def _subset_mask_numpy(counts: np.ndarray, masks: np.ndarray,
+                       avail: np.ndarray, reject_bits: np.uint32) -> np.ndarray:
+    """Vectorized fallback for subset_mask."""
+    out = (masks & reject_bits) == 0
+    candidates = np.nonzero(out)[0]
+    out[candidates] = (counts[candidates] <= avail).all(axis=1)
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # nogil lets the sharded scan run the kernel on several threads at once
+    @numba.njit(cache=True, boundscheck=False, fastmath=True, nogil=True)
+    def _subset_mask_numba(counts, masks, avail, reject_bits):
+        n = counts.shape[0]
+        out = np.empty(n, np.bool_)
+        for i in range(n):
+            if masks[i] & reject_bits:
+                out[i] = False
+                continue
+            ok = True
+            for j in range(26):
+                if counts[i, j] > avail[j]:
+                    ok = False
+                    break
+            out[i] = ok
+        return out
+
+
+def _best_candidate_numpy(counts: np.ndarray, indices: np.ndarray, values: np.ndarray,
+                          lengths: np.ndarray, bonus: np.ndarray) -> Tuple[int, int]:
+    """Vectorized fallback for best_candidate."""
+    if not len(indices):
+        return -1, 0
+    word_lengths = lengths[indices]
+    scores = counts[indices].astype(np.int64) @ values.astype(np.int64)
+    scores += bonus[np.minimum(word_lengths, len(bonus) - 1)]
+    # One O(n) argmax on a combined key; length only breaks score ties
+    best = int(np.argmax(scores * (int(word_lengths.max()) + 1) + word_lengths))
+    return best, int(scores[best])
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, boundscheck=False, nogil=True)
+    def _best_candidate_numba(counts, indices, values, lengths, bonus):
+        best = -1
+        best_score = 0
+        best_length = -1
+        bonus_cap = bonus.shape[0] - 1
+        for k in range(indices.shape[0]):
+            i = indices[k]
+            score = 0
+            for j in range(26):
+                score += counts[i, j] * values[j]
+            length = lengths[i]
+            score += bonus[min(length, bonus_cap)]
+            if best < 0 or score > best_score or (score == best_score and length > best_length):
+                best = k
+                best_score = score
+                best_length = length
+        return best, best_score
+
+
+def subset_mask(counts: np.ndarray, masks: np.ndarray,
+                avail: np.ndarray, reject_bits: int) -> np.ndarray:
+    """
+    Flag the words whose letters are a sub-multiset of the rack.
+    
+    Args:
+        counts: (N, 26) uint8 letter histograms
+        masks: (N,) uint32 letter-presence bitmasks
+        avail: (26,) uint8 rack letter counts
+        reject_bits: Bitmask of letters absent from the rack
+        
+    Returns:
+        Boolean array of length N
+    """
+    kernel: Callable[..., np.ndarray] = _subset_mask_numba if NUMBA_AVAILABLE else _subset_mask_numpy
+    reject = np.uint32(reject_bits)
+    
+    n_rows = counts.shape[0]
+    n_workers = os.cpu_count() or 1
+    if n_rows < PARALLEL_MIN_ROWS or n_workers < 2:
+        return kernel(counts, masks, avail, reject)
+    
+    # Both kernels release the GIL, so contiguous slices scan concurrently on threads
+    bounds = np.linspace(0, n_rows, n_workers + 1).astype(np.int64)
+    executor = _get_executor()
+    futures = [
+        executor.submit(kernel, counts[start:stop], masks[start:stop], avail, reject)
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+    return np.concatenate([future.result() for future in futures])
+
+
+def best_candidate(counts: np.ndarray, indices: np.ndarray, values: np.ndarray,
+                   lengths: np.ndarray, bonus: np.ndarray) -> Tuple[int, int]:
+    """
+    Score candidate words and pick the best one without leaving compiled code.
+    
+    Ties on score go to the longer word.
+    
+    Args:
+        counts: (N, 26) uint8 letter histograms
+        indices: Candidate row indices into counts
+        values: (26,) letter values
+        lengths: (N,) word lengths
+        bonus: Length bonus table indexed by length (last entry caps longer words)
+        
+    Returns:
+        Tuple of (position within indices, score), or (-1, 0) for no candidates
+    """
+    if NUMBA_AVAILABLE:
+        best, score = _best_candidate_numba(counts, indices, values, lengths, bonus)
+        return int(best), int(score)
+    return _best_candidate_numpy(counts, indices, values, lengths, bonus)
+
+
+def warm_up() -> None:
+    """Compile (or load cached) kernels on tiny inputs so the first real query is fast."""
+    if not NUMBA_AVAILABLE:
+        return
+    counts = np.zeros((1, 26), dtype=np.uint8)
+    masks = np.zeros(1, dtype=np.uint32)
+    avail = np.zeros(26, dtype=np.uint8)
+    _subset_mask_numba(counts, masks, avail, np.uint32(0))
+    _best_candidate_numba(counts, np.zeros(1, dtype=np.int64), np.zeros(26, dtype=np.int64),
+                          np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.int64))
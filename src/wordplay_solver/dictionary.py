@@ -1,8 +1,17 @@
 """Dictionary module for word validation."""
+import hashlib
+import mmap
 import os
+import pickle
+import re
 import sys
+from array import array
 from pathlib import Path
-from typing import Set, Optional
+from collections import defaultdict
+from functools import cached_property, lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Set, Optional, Sequence, Tuple
+
+from wordplay_solver.scoring import LENGTH_BONUSES
 
 # Try to import pkg_resources, but don't fail if not available
 try:
@@ -11,12 +20,45 @@ try:
 except ImportError:
     PKG_RESOURCES_AVAILABLE = False
 
+# Optional NumPy support for the vectorized letter-count index
+try:
+    import numpy as np
+    from wordplay_solver._kernels import subset_mask
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Default dictionary path - use local colins.txt file
 # Get the project root directory (where colins.txt is located)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DEFAULT_DICT_PATH = PROJECT_ROOT / 'colins.txt'
 DEFAULT_DICT_URL = 'https://raw.githubusercontent.com/dwyl/english-words/master/words_alpha.txt'
 
+# Resolved once at import so the default path skips expanduser/resolve per call
+_RESOLVED_DEFAULT = DEFAULT_DICT_PATH.expanduser().resolve()
+
+# Directory holding the pickled trie caches, one per dictionary file;
+# None means the per-user default, ~/.wordplay_solver (resolved on first use)
+CACHE_DIR: Optional[Path] = None
+# Name of the default cache directory inside the user's home directory
+CACHE_DIR_NAME = '.wordplay_solver'
+# Suffix of the pickled trie cache files
+CACHE_SUFFIX = '.trie.pkl'
+# Bump whenever the pickled layout changes so stale caches are rebuilt
+CACHE_VERSION = 5
+
+# Letters addressed by the 0-25 edge labels of the flattened word graph
+ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+
+# Byte translation table lowercasing ASCII letters
+_LOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+# A dictionary line holding a single word of ASCII letters (after lowercasing)
+_WORD_LINE_RE = re.compile(r'^[ \t]*([a-z]+)[ \t\r]*$', re.MULTILINE)
+
+# Number of distinct letter racks whose matches are memoized per Dictionary
+RACK_CACHE_SIZE = 256
+
 
 def ensure_dictionary_exists(dict_path: Optional[Path] = None) -> Path:
     """
@@ -29,15 +71,18 @@ def ensure_dictionary_exists(dict_path: Optional[Path] = None) -> Path:
         Path to the dictionary file
     """
     if dict_path is None:
-        dict_path = DEFAULT_DICT_PATH
+        dict_path = _RESOLVED_DEFAULT
+    else:
+        dict_path = Path(dict_path).expanduser().resolve()
     
-    dict_path = Path(dict_path).expanduser().resolve()
+    # A single stat answers both "exists?" and "empty?"
+    try:
+        size = dict_path.stat().st_size
+    except OSError:
+        # Also covers a non-directory or unreadable parent along the path
+        raise RuntimeError(f"Dictionary file not found at {dict_path}") from None
     
-    # Check if the dictionary file exists
-    if not dict_path.exists():
-        raise RuntimeError(f"Dictionary file not found at {dict_path}")
-    
-    if dict_path.stat().st_size == 0:
+    if size == 0:
         raise RuntimeError(f"Dictionary file is empty at {dict_path}")
     
     return dict_path
@@ -50,12 +95,253 @@ def load_dictionary(dict_path: Optional[Path] = None) -> Set[str]:
         dict_path: Path to dictionary file, uses default if None
         
     Returns:
-        Set of valid words in lowercase
+        Set of valid words in lowercase (ASCII letters only)
     """
     dict_path = ensure_dictionary_exists(dict_path)
     
-    with open(dict_path, 'r', encoding='utf-8') as f:
-        return {line.strip().lower() for line in f if line.strip().isalpha()}
+    # Map the file and let the regex engine pick out all-letter lines in C.
+    # latin-1 decodes byte-for-byte, so non-ASCII letters never match [a-z].
+    with open(dict_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[:].translate(_LOWER).decode('latin-1')
+    return set(_WORD_LINE_RE.findall(data))
+
+def build_trie(words: Iterable[str]) -> Dict:
+    """
+    Build a prefix trie from a set of words.
+    
+    Each node is a dict mapping a character to its child node. The ``None``
+    key marks a node that terminates a complete word.
+    
+    Args:
+        words: Words to insert into the trie
+        
+    Returns:
+        Root node of the trie
+    """
+    root: Dict = {}
+    for word in words:
+        node = root
+        for char in word:
+            child = node.get(char)
+            if child is None:
+                child = node[char] = {}
+            node = child
+        node[None] = True
+    return root
+
+def minimize_trie(root: Dict) -> Dict:
+    """
+    Minimize a trie into a DAWG by sharing structurally identical subtrees.
+    
+    Nodes keep the same dict layout as build_trie, so the anagram search
+    works unchanged; equivalent suffix subtrees simply become one shared
+    dict (and pickle shares them too).
+    
+    Args:
+        root: Root node from build_trie
+        
+    Returns:
+        Root node of the minimized graph
+    """
+    registry: Dict[Tuple, Dict] = {}
+    
+    def canonical(node: Dict) -> Dict:
+        for char, child in node.items():
+            if char is not None:
+                node[char] = canonical(child)
+        signature = tuple(sorted(
+            (char, id(child)) for char, child in node.items() if char is not None
+        )) + ((None in node),)
+        return registry.setdefault(signature, node)
+    
+    return canonical(root)
+
+def flatten_graph(root: Dict) -> Tuple[array, array, array, bytearray, bytearray]:
+    """
+    Pack a trie/DAWG into flat CSR arrays.
+    
+    Nodes are numbered in depth-first pre-order (root is 0). The edges of
+    node ``n`` are ``offsets[n]:offsets[n + 1]``, each with a letter index
+    ``labels[k]`` (0-25) and a destination node ``targets[k]``.
+    ``heights[n]`` is the length of the longest word suffix below node ``n``.
+    
+    Args:
+        root: Root node from build_trie or minimize_trie
+        
+    Returns:
+        Tuple of (offsets, labels, targets, terminal flags, heights)
+    """
+    numbering: Dict[int, int] = {id(root): 0}
+    order = [root]
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for char in sorted((char for char in node if char is not None), reverse=True):
+            child = node[char]
+            if id(child) not in numbering:
+                numbering[id(child)] = len(order)
+                order.append(child)
+                stack.append(child)
+    
+    node_heights: Dict[int, int] = {}
+    
+    def height(node: Dict) -> int:
+        known = node_heights.get(id(node))
+        if known is None:
+            known = max((1 + height(child) for char, child in node.items() if char is not None), default=0)
+            node_heights[id(node)] = known
+        return known
+    
+    offsets = array('I', [0])
+    labels = array('B')
+    targets = array('I')
+    terminal = bytearray(len(order))
+    heights = bytearray(len(order))
+    for number, node in enumerate(order):
+        terminal[number] = None in node
+        heights[number] = min(height(node), 255)
+        for char in sorted(char for char in node if char is not None):
+            labels.append(ord(char) - 97)
+            targets.append(numbering[id(node[char])])
+        offsets.append(len(labels))
+    return offsets, labels, targets, terminal, heights
+
+def build_letter_counts(word_list: List[str]) -> 'np.ndarray':
+    """
+    Build a per-word letter histogram matrix (one row per word, one column per letter).
+    
+    Args:
+        word_list: Lowercase ASCII words
+        
+    Returns:
+        uint8 array of shape (len(word_list), 26)
+    """
+    n_words = len(word_list)
+    lengths = np.fromiter(map(len, word_list), dtype=np.int64, count=n_words)
+    letters = np.frombuffer(''.join(word_list).encode('ascii'), dtype=np.uint8) - 97
+    rows = np.repeat(np.arange(n_words, dtype=np.int64), lengths)
+    flat = np.bincount(rows * 26 + letters, minlength=n_words * 26)
+    return flat.reshape(n_words, 26).astype(np.uint8)
+
+def build_letter_masks(counts: 'np.ndarray') -> 'np.ndarray':
+    """
+    Build a 26-bit letter-presence mask per word from its letter histogram.
+    
+    Args:
+        counts: Letter count matrix from build_letter_counts
+        
+    Returns:
+        uint32 array with bit i set when the word contains chr(97 + i)
+    """
+    bits = np.left_shift(np.uint32(1), np.arange(26, dtype=np.uint32))
+    return np.bitwise_or.reduce(np.where(counts > 0, bits, np.uint32(0)), axis=1)
+
+def count_rack_letters(letters: str) -> bytearray:
+    """
+    Count the ASCII letters of a rack into a 26-slot array.
+    
+    Counts saturate at 255; non-letters are ignored.
+    
+    Args:
+        letters: String of available letters
+        
+    Returns:
+        bytearray where slot i holds the count of chr(97 + i)
+    """
+    avail = bytearray(26)
+    for byte in letters.lower().encode('ascii', 'ignore'):
+        idx = byte - 97
+        if 0 <= idx < 26 and avail[idx] < 255:
+            avail[idx] += 1
+    return avail
+
+def _cache_tag(dict_path: Path) -> Tuple[int, int, int]:
+    """Identify a dictionary file revision (and cache layout) by mtime and size."""
+    stat = dict_path.stat()
+    return (CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+
+def _cache_path(dict_path: Path) -> Optional[Path]:
+    """
+    Locate the trie cache for a dictionary file inside the cache directory.
+    
+    The name carries a hash of the full resolved path, so dictionaries that
+    share a stem (or live in different directories) never collide.
+    
+    Args:
+        dict_path: Resolved path to the source dictionary file
+        
+    Returns:
+        Path of the cache file, or None if there is no home directory to cache in
+    """
+    cache_dir = CACHE_DIR
+    if cache_dir is None:
+        try:
+            cache_dir = Path.home() / CACHE_DIR_NAME
+        except (RuntimeError, KeyError):
+            # No HOME and no passwd entry (e.g. an arbitrary uid in a container)
+            return None
+    digest = hashlib.sha256(str(dict_path).encode('utf-8', 'surrogateescape')).hexdigest()[:16]
+    return cache_dir / f'{dict_path.stem}-{digest}{CACHE_SUFFIX}'
+
+def load_cached_trie(dict_path: Path) -> Optional[Tuple[List[str], Tuple]]:
+    """
+    Load the pickled word list and word graph for a dictionary file, if still fresh.
+    
+    Any failure to read or unpack the cache counts as a miss.
+    
+    Args:
+        dict_path: Resolved path to the source dictionary file
+        
+    Returns:
+        Tuple of (word list, flattened graph), or None if the cache is missing or stale
+    """
+    cache_path = _cache_path(dict_path)
+    if cache_path is None:
+        return None
+    try:
+        with open(cache_path, 'rb') as f:
+            # Only unpickle files this user wrote; the cache directory is private to them
+            if hasattr(os, 'getuid') and os.fstat(f.fileno()).st_uid != os.getuid():
+                return None
+            # Unpickle straight from the page cache rather than through a buffered reader
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                tag, words, graph = pickle.loads(mm)
+        if tag != _cache_tag(dict_path):
+            return None
+    except Exception:
+        return None
+    return words, graph
+
+def save_cached_trie(dict_path: Path, words: List[str], graph: Tuple) -> None:
+    """
+    Pickle the word list and word graph into the per-user cache directory.
+    
+    Failures (e.g. an unwritable home directory) are ignored; the cache is an
+    optimization only.
+    
+    Args:
+        dict_path: Resolved path to the source dictionary file
+        words: Word list ordered by (length, word)
+        graph: Flattened word graph from flatten_graph
+    """
+    cache_path = _cache_path(dict_path)
+    if cache_path is None:
+        return
+    tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((_cache_tag(dict_path), words, graph), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Don't leave a partial temp file behind (e.g. after a full disk)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+# Loaded dictionary indexes keyed by resolved path, tagged with the file revision
+_DICT_CACHE: Dict[Path, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
 
 class Dictionary:
     """Dictionary for word validation."""
@@ -67,7 +353,72 @@ class Dictionary:
         Args:
             dict_path: Path to dictionary file, uses default if None
         """
-        self.words = load_dictionary(dict_path)
+        dict_path = ensure_dictionary_exists(dict_path)
+        
+        # Instances for the same unchanged file share one set of read-only indexes
+        tag = _cache_tag(dict_path)
+        shared = _DICT_CACHE.get(dict_path)
+        if shared is not None and shared[0] == tag:
+            self.__dict__.update(shared[1])
+        else:
+            self._load_indexes(dict_path)
+            shared = (tag, dict(self.__dict__))
+            _DICT_CACHE[dict_path] = shared
+        
+        # Indexes built lazily later are published here so sibling instances reuse them
+        self._shared_indexes = shared[1]
+        
+        # Memoize trie searches per instance, keyed by the sorted rack
+        self._words_for_rack = lru_cache(maxsize=RACK_CACHE_SIZE)(self._search_trie)
+    
+    def _load_indexes(self, dict_path: Path) -> None:
+        """
+        Load the word list and build every lookup structure for a dictionary file.
+        
+        Args:
+            dict_path: Resolved path to the dictionary file
+        """
+        cached = load_cached_trie(dict_path)
+        if cached is not None:
+            # The words set is built lazily on first lookup; see the words property
+            self.word_list, graph = cached
+        else:
+            self.words = load_dictionary(dict_path)
+            self.word_list = sorted(self.words, key=lambda word: (len(word), word))
+            graph = flatten_graph(minimize_trie(build_trie(self.word_list)))
+            save_cached_trie(dict_path, self.word_list, graph)
+        
+        # Word graph (minimized trie) as CSR arrays, see flatten_graph
+        (self.node_offsets, self.edge_labels, self.edge_targets,
+         self.node_terminal, self.node_heights) = graph
+        
+        # word_list is ordered by length, so each length bucket is a contiguous run
+        self.by_length: Dict[int, List[str]] = defaultdict(list)
+        for word in self.word_list:
+            self.by_length[len(word)].append(word)
+        self.max_length = max(self.by_length, default=0)
+        
+        # Structure-of-arrays letter histograms, indexed like word_list
+        self.counts: Optional['np.ndarray']
+        self.masks: Optional['np.ndarray']
+        self.lengths: Optional['np.ndarray']
+        if NUMPY_AVAILABLE:
+            self.counts = build_letter_counts(self.word_list)
+            self.masks = build_letter_masks(self.counts)
+            self.lengths = np.fromiter(map(len, self.word_list), dtype=np.int32, count=len(self.word_list))
+        else:
+            self.counts = None
+            self.masks = None
+            self.lengths = None
+    
+    @cached_property
+    def words(self) -> Set[str]:
+        """Set of all dictionary words, built on first use when loaded from the cache."""
+        words = self._shared_indexes.get('words')
+        if words is None:
+            words = set(self.word_list)
+            self._shared_indexes['words'] = words
+        return words
     
     def is_valid_word(self, word: str) -> bool:
         """
@@ -79,7 +430,29 @@ class Dictionary:
         Returns:
             True if the word is valid, False otherwise
         """
-        return word.lower() in self.words
+        # Cheap first stage: nothing longer than the longest stored word can match
+        if len(word) > self.max_length:
+            return False
+        # Stored words are lowercase; only allocate a lowered copy when needed
+        return word in self.words if word.islower() else word.lower() in self.words
+    
+    def iter_words_up_to(self, max_len: int) -> Iterator[str]:
+        """
+        Iterate over dictionary words no longer than max_len, shortest first.
+        
+        Args:
+            max_len: Maximum word length to yield
+            
+        Yields:
+            Words from the length buckets 1..max_len
+        """
+        for length in range(1, min(max_len, self.max_length) + 1):
+            yield from self.by_length.get(length, ())
+    
+    def count_words_up_to(self, max_len: int) -> int:
+        """Number of dictionary words no longer than max_len (a word_list prefix)."""
+        top = min(max_len, self.max_length)
+        return sum(len(self.by_length.get(length, ())) for length in range(1, top + 1))
     
     def get_words_with_letters(self, letters: str) -> Set[str]:
         """
@@ -91,14 +464,178 @@ class Dictionary:
         Returns:
             Set of valid words
         """
-        from collections import Counter
+        # Anagram racks share results, so key the cache by the sorted letters
+        rack = ''.join(sorted(letters.lower()))
+        return set(self._words_for_rack(rack))
+    
+    def _search_trie(self, rack: str) -> FrozenSet[str]:
+        """
+        Walk the word graph collecting every word that can be formed from the rack.
+        
+        Args:
+            rack: Lowercase available letters
+            
+        Returns:
+            Frozen set of matching words
+        """
+        avail = count_rack_letters(rack)
+        
+        offsets = self.node_offsets
+        labels = self.edge_labels
+        targets = self.edge_targets
+        terminal = self.node_terminal
+        valid_words: Set[str] = set()
+        path: List[str] = []
+        
+        def walk(node: int) -> None:
+            if terminal[node]:
+                valid_words.add(''.join(path))
+            for edge in range(offsets[node], offsets[node + 1]):
+                idx = labels[edge]
+                if avail[idx] == 0:
+                    continue  # Prune the whole subtree below this letter
+                avail[idx] -= 1
+                path.append(ALPHABET[idx])
+                walk(targets[edge])
+                path.pop()
+                avail[idx] += 1
+        
+        walk(0)
+        return frozenset(valid_words)
+    
+    def get_scored_words_with_letters(self, letters: str, values: Sequence[int]) -> List[Tuple[str, int, int]]:
+        """
+        Get all valid words formable from the letters, scored during the graph walk.
+        
+        Each word's letter sum is carried down the search path, so no word is
+        re-scored character by character afterwards. Scores follow
+        calculate_word_score (letter values plus length bonus).
+        
+        Args:
+            letters: String of available letters
+            values: 26 letter values indexed by ord(letter) - 97
+            
+        Returns:
+            Unordered list of (word, score, length) tuples
+        """
+        avail = count_rack_letters(letters)
+        bonus = [LENGTH_BONUSES[min(length, len(LENGTH_BONUSES) - 1)] for length in range(sum(avail) + 1)]
+        
+        offsets = self.node_offsets
+        labels = self.edge_labels
+        targets = self.edge_targets
+        terminal = self.node_terminal
+        scored: List[Tuple[str, int, int]] = []
+        path: List[str] = []
+        
+        def walk(node: int, depth: int, score: int) -> None:
+            if terminal[node] and depth:
+                scored.append((''.join(path), score + bonus[depth], depth))
+            depth += 1
+            for edge in range(offsets[node], offsets[node + 1]):
+                idx = labels[edge]
+                if avail[idx] == 0:
+                    continue
+                avail[idx] -= 1
+                path.append(ALPHABET[idx])
+                walk(targets[edge], depth, score + values[idx])
+                path.pop()
+                avail[idx] += 1
+        
+        walk(0, 0, 0)
+        return scored
+    
+    def find_best_scoring_word(self, letters: str, values: Sequence[int]) -> Tuple[str, int]:
+        """
+        Branch-and-bound search for the highest scoring word formable from the letters.
+        
+        Scores follow calculate_word_score: the sum of per-letter values plus the
+        length bonus. A subtree is skipped once an upper bound on any word below
+        it (best remaining rack letters, capped by the subtree height, plus the
+        largest reachable length bonus) cannot beat the best word found so far.
+        
+        Args:
+            letters: String of available letters
+            values: 26 letter values indexed by ord(letter) - 97
+            
+        Returns:
+            Tuple of (best_word, score), or ("", 0) if no word can be formed
+        """
+        avail = count_rack_letters(letters)
+        rack_values = [value for value, count in zip(values, avail) for _ in range(count)]
+        
+        # top_gain[k]: most any k (or fewer) remaining rack letters can add
+        rack_values.sort(reverse=True)
+        top_gain = [0]
+        for value in rack_values:
+            top_gain.append(max(top_gain[-1], top_gain[-1] + value))
+        n_letters = len(rack_values)
+        
+        offsets = self.node_offsets
+        labels = self.edge_labels
+        targets = self.edge_targets
+        terminal = self.node_terminal
+        heights = self.node_heights
+        # Length bonus for every reachable depth, so the hot loop never clamps
+        bonus = [LENGTH_BONUSES[min(length, len(LENGTH_BONUSES) - 1)] for length in range(n_letters + 1)]
+        best: List = ["", 0, -1]  # word, score, length (-1 until a word is found)
+        path: List[str] = []
+        
+        def walk(node: int, depth: int, score: int, gain_left: int) -> None:
+            if terminal[node] and depth:
+                total = score + bonus[depth]
+                if total > best[1] or (total == best[1] and depth > best[2]) or best[2] < 0:
+                    best[0], best[1], best[2] = ''.join(path), total, depth
+            reach = heights[node]
+            if reach > n_letters - depth:
+                reach = n_letters - depth
+            if reach == 0:
+                return
+            if best[2] >= 0:
+                gain = top_gain[reach]
+                if gain > gain_left:
+                    gain = gain_left
+                bound = score + gain + bonus[depth + reach]
+                if bound < best[1] or (bound == best[1] and depth + reach <= best[2]):
+                    return
+            depth += 1
+            for edge in range(offsets[node], offsets[node + 1]):
+                idx = labels[edge]
+                if avail[idx]:
+                    value = values[idx]
+                    avail[idx] -= 1
+                    path.append(ALPHABET[idx])
+                    walk(targets[edge], depth, score + value, gain_left - value if value > 0 else gain_left)
+                    path.pop()
+                    avail[idx] += 1
+        
+        walk(0, 0, 0, sum(max(value, 0) for value in rack_values))
+        if best[2] < 0:
+            return "", 0
+        return best[0], best[1]
+    
+    def find_word_indices(self, letters: str) -> 'np.ndarray':
+        """
+        Vectorized counterpart of get_words_with_letters using the letter-count matrix.
+        
+        Args:
+            letters: String of available letters
+            
+        Returns:
+            Indices into ``word_list`` of the words that can be formed
+        """
+        counts, masks = self.counts, self.masks
+        if counts is None or masks is None:
+            raise ImportError("NumPy is required for find_word_indices. Install with: pip install numpy")
         
-        letter_count = Counter(letters.lower())
-        valid_words = set()
+        rack = count_rack_letters(letters)
+        avail = np.frombuffer(bytes(rack), dtype=np.uint8)
+        avail_mask = sum(1 << idx for idx, count in enumerate(rack) if count)
+        n_letters = sum(rack)
         
-        for word in self.words:
-            word_count = Counter(word)
-            if all(word_count[char] <= letter_count.get(char, 0) for char in word_count):
-                valid_words.add(word)
+        # Words longer than the rack can never fit; they form the tail of word_list
+        end = self.count_words_up_to(n_letters)
         
-        return valid_words
+        # Bitmask prefilter plus per-letter count check (Numba-compiled when available)
+        reject_bits = ~avail_mask & 0x3FFFFFF
+        return np.nonzero(subset_mask(counts[:end], masks[:end], avail, reject_bits))[0]
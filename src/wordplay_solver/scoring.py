@@ -1,5 +1,5 @@
 """Scoring module for wordplay solver."""
-import configparser
+import re
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -11,6 +11,40 @@ STANDARD_LETTER_VALUES = {
     'y': 4, 'z': 10
 }
 
+# Byte translation table mapping each ASCII letter (either case) to its
+# standard value, so a word's base score is sum(word_bytes.translate(...))
+_VALUE_TABLE = bytes(
+    STANDARD_LETTER_VALUES.get(chr(i).lower(), 0) if chr(i).isalpha() else 0
+    for i in range(256)
+)
+
+# Standard value per ASCII ordinal (either case), for hot paths that index by ord()
+_STD_LUT = tuple(_VALUE_TABLE[:128])
+
+# Accumulated length bonus indexed by word length (capped at 20 letters)
+LENGTH_BONUSES = (
+    0, 0, 0, 0, 0,          # No bonus for 4 letters or less
+    5, 10, 15,              # +5 each for 5th, 6th, 7th
+    25, 35,                 # +10 each for 8th, 9th
+    50, 65,                 # +15 each for 10th, 11th
+    85, 105, 125,           # +20 each for 12th, 13th, 14th
+    150, 175, 200,          # +25 each for 15th, 16th, 17th
+    230,                    # +30 for 18th
+    270,                    # +40 for 19th
+    320,                    # +50 for 20th
+)
+_MAX_BONUS_LENGTH = len(LENGTH_BONUSES)
+_MAX_LENGTH_BONUS = LENGTH_BONUSES[-1]
+
+# A letter optionally followed by its inline value, e.g. "a1" or "b" in "a1b3c"
+_LETTER_INPUT_RE = re.compile(r'([A-Za-z])(\d*)')
+
+# Body of the [letter_values] section, up to the next section header or end of file
+_SECTION_RE = re.compile(r'^[ \t]*\[letter_values\][ \t]*$(.*?)(?=^[ \t]*\[|\Z)', re.MULTILINE | re.DOTALL)
+
+# A single-letter key with an integer value, e.g. "a = 2" or "  q: 8"
+_KV_RE = re.compile(r'^[ \t]*([A-Za-z])[ \t]*[=:][ \t]*([+-]?\d+)[ \t]*$', re.MULTILINE)
+
 def get_letter_values(config_path: Optional[str] = None) -> Dict[str, int]:
     """
     Get letter values, optionally loading overrides from a config file.
@@ -24,16 +58,14 @@ def get_letter_values(config_path: Optional[str] = None) -> Dict[str, int]:
     letter_values = STANDARD_LETTER_VALUES.copy()
     
     if config_path and Path(config_path).exists():
-        config = configparser.ConfigParser()
-        config.read(config_path)
+        # The section is flat letter = value lines, so a regex replaces configparser;
+        # comments and invalid values simply don't match. Unlike configparser,
+        # keys from a [DEFAULT] section are not inherited.
+        section = _SECTION_RE.search(Path(config_path).read_text())
         
-        if 'letter_values' in config:
-            for letter, value in config['letter_values'].items():
-                if len(letter) == 1 and letter.isalpha():
-                    try:
-                        letter_values[letter.lower()] = int(value)
-                    except (ValueError, TypeError):
-                        pass  # Skip invalid values
+        if section:
+            for letter, value in _KV_RE.findall(section.group(1)):
+                letter_values[letter.lower()] = int(value)
     
     return letter_values
 
@@ -57,21 +89,8 @@ def calculate_length_bonus(word_length: int) -> int:
     Returns:
         Total length bonus points
     """
-    # Accumulated bonus points by word length
-    length_bonuses = {
-        0: 0, 1: 0, 2: 0, 3: 0, 4: 0,           # No bonus for 4 letters or less
-        5: 5, 6: 10, 7: 15,                      # +5 each for 5th, 6th, 7th
-        8: 25, 9: 35,                            # +10 each for 8th, 9th (15 + 10, 15 + 20)
-        10: 50, 11: 65,                          # +15 each for 10th, 11th (35 + 15, 35 + 30)
-        12: 85, 13: 105, 14: 125,               # +20 each for 12th, 13th, 14th
-        15: 150, 16: 175, 17: 200,              # +25 each for 15th, 16th, 17th
-        18: 230,                                 # +30 for 18th
-        19: 270,                                 # +40 for 19th
-        20: 320                                  # +50 for 20th
-    }
-    
-    # Return the bonus for the exact length, or the highest available if longer than 20
-    return length_bonuses.get(word_length, length_bonuses[20])
+    # Longer words get the 20-letter bonus
+    return LENGTH_BONUSES[word_length] if word_length < _MAX_BONUS_LENGTH else _MAX_LENGTH_BONUS
 
 def parse_letter_input(letter_str: str) -> Dict[str, int]:
     """
@@ -86,28 +105,11 @@ def parse_letter_input(letter_str: str) -> Dict[str, int]:
     Returns:
         Dictionary mapping letters to their values
     """
-    letters = {}
-    i = 0
-    n = len(letter_str)
-    
-    while i < n:
-        if not letter_str[i].isalpha():
-            i += 1
-            continue
-            
-        char = letter_str[i].lower()
-        i += 1
-        
-        # Check if next characters form a number
-        num_str = ''
-        while i < n and letter_str[i].isdigit():
-            num_str += letter_str[i]
-            i += 1
-            
-        value = int(num_str) if num_str else STANDARD_LETTER_VALUES.get(char, 1)
-        letters[char] = value
-    
-    return letters
+    # Later occurrences of a letter overwrite earlier ones
+    return {
+        letter.lower(): int(digits) if digits else _STD_LUT[ord(letter)]
+        for letter, digits in _LETTER_INPUT_RE.findall(letter_str)
+    }
 
 def calculate_word_score(word: str, letter_values: Optional[Dict[str, int]] = None) -> int:
     """
@@ -121,12 +123,13 @@ def calculate_word_score(word: str, letter_values: Optional[Dict[str, int]] = No
         The total score of the word including length bonuses
     """
     if letter_values is None:
-        letter_values = STANDARD_LETTER_VALUES
-    
-    # Calculate base score from letter values
-    base_score = sum(letter_values.get(letter.lower(), 0) for letter in word if letter.isalpha())
-    
-    # Calculate length bonus
-    length_bonus = calculate_length_bonus(len(word))
+        # Fast path: translate ASCII letters straight to their values in C
+        base_score = sum(word.encode('ascii', 'ignore').translate(_VALUE_TABLE))
+    else:
+        # Lowercase once; letter-value keys are letters, so other characters score 0
+        get_value = letter_values.get
+        base_score = sum(get_value(letter, 0) for letter in word.lower())
     
-    return base_score + length_bonus
+    # Length bonus lookup inlined to skip a function call per scored word
+    length = len(word)
+    return base_score + (LENGTH_BONUSES[length] if length < _MAX_BONUS_LENGTH else _MAX_LENGTH_BONUS)
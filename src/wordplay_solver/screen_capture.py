@@ -3,8 +3,10 @@ Screen capture and OCR functionality for detecting available letters.
 Supports both OCR text recognition and window-specific capture.
 """
 import re
+import tempfile
 import time
-from typing import List, Optional, Tuple, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
 
 if TYPE_CHECKING:
@@ -15,19 +17,84 @@ try:
     import numpy as np
     import pyautogui
     import pytesseract
-    from PIL import Image, ImageEnhance
+    import PIL.Image
+    from PIL import ImageEnhance
     SCREEN_DEPS_AVAILABLE = True
 except ImportError:
     SCREEN_DEPS_AVAILABLE = False
-    Image = None
     ImageEnhance = None
 
+# Optional faster capture backend (falls back to pyautogui.screenshot)
+try:
+    import mss  # type: ignore[import-not-found]
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+# Optional in-process OCR engine (falls back to the pytesseract subprocess)
+try:
+    from tesserocr import OEM, PSM, PyTessBaseAPI  # type: ignore[import-not-found]
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# pygetwindow module (or False once it failed to import), loaded on first window lookup
+_pygetwindow: Any = None
+
+
+def _get_pygetwindow() -> Any:
+    """
+    Import pygetwindow once, on first use, and remember the outcome.
+    
+    Kept out of module import so solver-only users never pay for it.
+    
+    Returns:
+        The pygetwindow module, or None if it is missing or unsupported here
+    """
+    global _pygetwindow
+    if _pygetwindow is None:
+        try:
+            import pygetwindow
+            _pygetwindow = pygetwindow
+        except (ImportError, NotImplementedError):
+            # pygetwindow raises NotImplementedError on unsupported platforms
+            _pygetwindow = False
+    return _pygetwindow or None
+
+# Letters the game can show; OCR is restricted to these
+OCR_CHAR_WHITELIST = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Disable dictionaries and optimize for single letter recognition
+# The game text is individual letters, not real words
+PYTESSERACT_CONFIG = (
+    f'--oem 3 --psm 6 -c tessedit_char_whitelist={OCR_CHAR_WHITELIST} '
+    'load_system_dawg=false load_freq_dawg=false'
+)
+
+# Glyph height (px) that tesseract reads reliably; larger text is scaled down to it
+OCR_TARGET_GLYPH_HEIGHT = 30
+
+# Dark components smaller than this many pixels are specks, not glyphs
+_MIN_GLYPH_AREA = 20
+
+# Minimum normalized correlation for a template match to be trusted over OCR
+TEMPLATE_MATCH_THRESHOLD = 0.6
+
+# Byte tables for cleaning OCR output: uppercase ASCII letters, drop every other byte
+_UPPER_TABLE = bytes.maketrans(b'abcdefghijklmnopqrstuvwxyz', b'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_NON_LETTERS = bytes(c for c in range(256) if not chr(c).isascii() or not chr(c).isalpha())
+
 
 class ScreenCapture:
     """Handle screen capture and letter detection."""
     
-    def __init__(self):
-        """Initialize screen capture with dependency check."""
+    def __init__(self, template_dir: Optional[str] = None):
+        """
+        Initialize screen capture with dependency check.
+        
+        Args:
+            template_dir: Optional directory of A.png-Z.png glyph crops for template matching
+        """
         if not SCREEN_DEPS_AVAILABLE:
             raise ImportError(
                 "Screen capture dependencies not installed. "
@@ -37,6 +104,18 @@ class ScreenCapture:
         # Disable pyautogui failsafe for smoother operation
         pyautogui.FAILSAFE = False
         
+        # Reused mss grabber: one framebuffer copy per capture, no per-call handle setup
+        self._sct = mss.mss() if MSS_AVAILABLE else None
+        
+        # Persistent tesseract engine, so each OCR call skips process launch and model load
+        self._api = self._init_ocr_api() if TESSEROCR_AVAILABLE else None
+        
+        # Letter -> preprocessed glyph crop; empty means always use OCR
+        self._templates = self._load_templates(template_dir) if template_dir else {}
+        
+        # Window title -> (matched title, geometry), so background polling skips window enumeration
+        self._geom_cache: Dict[str, Tuple[str, Tuple[int, int, int, int]]] = {}
+        
         # Common letter patterns for different games
         self.letter_patterns = {
             'scrabble': r'[A-Z]',
@@ -44,6 +123,60 @@ class ScreenCapture:
             'generic': r'[A-Za-z]'
         }
     
+    def _init_ocr_api(self) -> Optional['PyTessBaseAPI']:
+        """
+        Create a tesserocr engine configured like the pytesseract call.
+        
+        Returns:
+            Initialized API, or None if tesseract data could not be loaded
+        """
+        try:
+            api = PyTessBaseAPI(init=False)
+        except Exception:
+            return None
+        try:
+            # Dictionaries are init-only settings; the game shows single letters, not words
+            api.Init(oem=OEM.DEFAULT, variables={'load_system_dawg': 'false',
+                                                 'load_freq_dawg': 'false'})
+            api.SetPageSegMode(PSM.SINGLE_BLOCK)
+            api.SetVariable('tessedit_char_whitelist', OCR_CHAR_WHITELIST)
+            return api
+        except Exception:
+            # Release the native handle before falling back to pytesseract
+            api.End()
+            return None
+    
+    def _load_templates(self, template_dir: str) -> Dict[str, 'np.ndarray']:
+        """
+        Load per-letter glyph templates, preprocessed the same way as captures.
+        
+        Args:
+            template_dir: Directory holding one image per letter, named A.png to Z.png
+            
+        Returns:
+            Dictionary mapping uppercase letters to grayscale template arrays
+        """
+        templates = {}
+        for letter in OCR_CHAR_WHITELIST:
+            path = Path(template_dir) / f'{letter}.png'
+            if path.exists():
+                templates[letter] = np.asarray(self.preprocess_image(PIL.Image.open(path)))
+        return templates
+    
+    def close(self) -> None:
+        """Release the persistent OCR engine and screen grabber."""
+        api = getattr(self, '_api', None)
+        if api is not None:
+            api.End()
+            self._api = None
+        sct = getattr(self, '_sct', None)
+        if sct is not None:
+            sct.close()
+            self._sct = None
+    
+    def __del__(self):
+        self.close()
+    
     def capture_screen_region(self, 
                             x: int = None, 
                             y: int = None, 
@@ -61,13 +194,37 @@ class ScreenCapture:
         """
         if all(param is None for param in [x, y, width, height]):
             # Full screen capture
-            screenshot = pyautogui.screenshot()
+            screenshot = self._screenshot()
         else:
             # Region capture
-            screenshot = pyautogui.screenshot(region=(x, y, width, height))
+            screenshot = self._screenshot(region=(x, y, width, height))
         
         return screenshot
     
+    def _screenshot(self, region: Optional[Tuple[int, int, int, int]] = None) -> 'Image':
+        """
+        Grab the primary screen or a region of it.
+        
+        Uses mss when installed (raw RGB straight from the OS), otherwise
+        pyautogui.screenshot.
+        
+        Args:
+            region: Optional (x, y, width, height); None for the full screen
+            
+        Returns:
+            PIL Image of the captured area
+        """
+        if self._sct is None:
+            return pyautogui.screenshot(region=region) if region else pyautogui.screenshot()
+        
+        if region is None:
+            monitor = self._sct.monitors[1]
+        else:
+            left, top, width, height = region
+            monitor = {'left': left, 'top': top, 'width': width, 'height': height}
+        raw = self._sct.grab(monitor)
+        return PIL.Image.frombytes('RGB', raw.size, raw.rgb)
+    
     def capture_window_by_title(self, window_title: str, 
                                delay_mode: str = 'countdown',
                                delay_seconds: int = 0,
@@ -92,37 +249,19 @@ class ScreenCapture:
         Returns:
             PIL Image of the window (cropped if requested) or None if not found
         """
+        gw = _get_pygetwindow()
+        if gw is None:
+            return None
+        
         try:
-            # Use pygetwindow to find the window
-            import pygetwindow as gw
-            
-            # Get all window titles and find matches
-            all_titles = gw.getAllTitles()
-            matching_titles = [title for title in all_titles if window_title.lower() in title.lower()]
-            
-            if not matching_titles:
-                return None
-            
-            # Use the first matching title to get the window
-            target_title = matching_titles[0]
-            
-            # Get window geometry using the exact title
-            try:
-                geometry = gw.getWindowGeometry(target_title)
-                window_left, window_top, window_width, window_height = geometry
-                
-                # Validate geometry - check if coordinates are reasonable
-                if window_width <= 0 or window_height <= 0:
+            # Background polling reuses the last geometry; other modes may have moved the window
+            cached = self._geom_cache.get(window_title) if delay_mode == 'background' else None
+            if cached is None:
+                cached = self._find_window_geometry(window_title)
+                if cached is None:
                     return None
-                
-                # Check if window is completely off-screen (basic validation)
-                screen_width, screen_height = pyautogui.size()
-                if (window_left + window_width < 0 or window_top + window_height < 0 or 
-                    window_left > screen_width or window_top > screen_height):
-                    pass  # Continue anyway
-                    
-            except Exception as e:
-                return None
+                self._geom_cache[window_title] = cached
+            target_title, (window_left, window_top, window_width, window_height) = cached
             
             # Handle different delay modes
             if delay_mode == 'countdown':
@@ -146,9 +285,9 @@ class ScreenCapture:
             
             # Capture the window region using the geometry we got
             try:
-                screenshot = pyautogui.screenshot(region=(
+                screenshot = self._screenshot(region=(
                     int(window_left), int(window_top), int(window_width), int(window_height)
-))
+                ))
                 
                 # Apply cropping if requested
                 if crop_to_center:
@@ -177,9 +316,12 @@ class ScreenCapture:
                 return screenshot
                 
             except Exception as screenshot_error:
+                # The window may have moved or closed; look it up again next time
+                self._geom_cache.pop(window_title, None)
+                
                 # Fallback 1: Try capturing without region (full screen) and crop later
                 try:
-                    full_screenshot = pyautogui.screenshot()
+                    full_screenshot = self._screenshot()
                     # Crop to the window region if coordinates are valid
                     if (window_left >= 0 and window_top >= 0 and 
                         window_left + window_width <= full_screenshot.width and 
@@ -199,6 +341,87 @@ class ScreenCapture:
         except Exception as e:
             return None
     
+    def _find_window_geometry(self, window_title: str) -> Optional[Tuple[str, Tuple[int, int, int, int]]]:
+        """
+        Look up the first window whose title contains the given text.
+        
+        Args:
+            window_title: Partial or full window title to match
+            
+        Returns:
+            Tuple of (matched title, (left, top, width, height)) or None if not found
+        """
+        gw = _get_pygetwindow()
+        
+        # Get all window titles and find matches
+        all_titles = gw.getAllTitles()
+        matching_titles = [title for title in all_titles if window_title.lower() in title.lower()]
+        
+        if not matching_titles:
+            return None
+        
+        # Use the first matching title to get the window
+        target_title = matching_titles[0]
+        
+        # Get window geometry using the exact title
+        try:
+            geometry = gw.getWindowGeometry(target_title)
+            window_left, window_top, window_width, window_height = geometry
+            
+            # Validate geometry - check if coordinates are reasonable
+            if window_width <= 0 or window_height <= 0:
+                return None
+            
+            # Check if window is completely off-screen (basic validation)
+            screen_width, screen_height = pyautogui.size()
+            if (window_left + window_width < 0 or window_top + window_height < 0 or 
+                window_left > screen_width or window_top > screen_height):
+                pass  # Continue anyway
+                
+        except Exception as e:
+            return None
+        
+        return target_title, (window_left, window_top, window_width, window_height)
+    
+    def detect_letters_via_templates(self, 
+                                     image: 'Image', 
+                                     tile_rois: List[Tuple[int, int, int, int]]) -> Optional[List[str]]:
+        """
+        Read one letter per tile by matching glyph templates instead of running OCR.
+        
+        For a known game the font and tile positions are fixed, so correlating
+        each tile against the 26 templates is far cheaper than tesseract.
+        
+        Library-only: the CLI does not pass template_dir or tile positions, so
+        callers construct ScreenCapture(template_dir=...) and supply the ROIs.
+        
+        Args:
+            image: Captured PIL Image
+            tile_rois: (x, y, width, height) of each tile within the image
+            
+        Returns:
+            Letters in tile order, or None if no templates are loaded or any
+            tile has no confident match (callers should fall back to OCR)
+        """
+        if not self._templates:
+            return None
+        
+        pixels = np.asarray(self.preprocess_image(image))
+        letters = []
+        for x, y, width, height in tile_rois:
+            tile = pixels[y:y + height, x:x + width]
+            best_letter, best_score = None, TEMPLATE_MATCH_THRESHOLD
+            for letter, template in self._templates.items():
+                if template.shape[0] > tile.shape[0] or template.shape[1] > tile.shape[1]:
+                    continue
+                score = cv2.matchTemplate(tile, template, cv2.TM_CCOEFF_NORMED).max()
+                if score > best_score:
+                    best_letter, best_score = letter, score
+            if best_letter is None:
+                return None
+            letters.append(best_letter)
+        return letters
+    
     def preprocess_image(self, image: 'Image') -> 'Image':
         """
         Preprocess image for better OCR results, focusing on black text only.
@@ -212,30 +435,50 @@ class ScreenCapture:
         # Convert to RGB if not already
         if image.mode != 'RGB':
             image = image.convert('RGB')
-
-        # Convert to numpy array for color filtering
-        img_array = np.array(image)
         
-        img_array = cv2.GaussianBlur(img_array, (5, 5), 6)
+        # Work on a single uint8 channel: grayscale first, then blur. Both steps
+        # are linear, but each rounds to uint8, so this only approximates the
+        # blur-then-grayscale order (pixels right at the threshold can flip);
+        # accepted for blurring one channel instead of three
+        gray = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+        gray = cv2.GaussianBlur(gray, (5, 5), 6)
         
-        # Create mask for black/dark text
-        # Define what we consider "black" - adjust these thresholds as needed
-        black_threshold = 30  # Pixels darker than this are considered black (more selective)
+        # Keep only black/dark text: pixels darker than this become black,
+        # everything else becomes white background
+        black_threshold = 30
+        _, binary_image = cv2.threshold(gray, black_threshold - 1, 255, cv2.THRESH_BINARY)
         
-        # Calculate grayscale values
-        gray_values = np.dot(img_array[...,:3], [0.299, 0.587, 0.114])
+        return PIL.Image.fromarray(binary_image, mode='L')
+    
+    def downscale_for_ocr(self, image: 'Image') -> 'Image':
+        """
+        Shrink a preprocessed image so its glyphs are about OCR_TARGET_GLYPH_HEIGHT tall.
         
-        # Create mask for black text (dark pixels)
-        black_mask = gray_values < black_threshold
+        Tesseract's run time grows with pixel count, and large screenshot text
+        gains nothing in accuracy. Glyph height is the median height of the
+        dark connected components; images whose text is already small are
+        returned unchanged.
         
-        # Create binary image: black text on white background
-        binary_image = np.ones_like(gray_values) * 255  # Start with white background
-        binary_image[black_mask] = 0  # Set black text pixels to black
-
-        # Convert to PIL Image
-        result_image = Image.fromarray(binary_image.astype(np.uint8), mode='L')
+        Args:
+            image: Preprocessed (black text on white) PIL Image
+            
+        Returns:
+            Downscaled PIL Image, or the input if no shrinking is needed
+        """
+        pixels = np.asarray(image)
+        count, _, stats, _ = cv2.connectedComponentsWithStats((pixels == 0).astype(np.uint8))
+        
+        # Label 0 is the background
+        heights = stats[1:, cv2.CC_STAT_HEIGHT][stats[1:, cv2.CC_STAT_AREA] >= _MIN_GLYPH_AREA]
+        if heights.size == 0:
+            return image
         
-        return result_image
+        scale = OCR_TARGET_GLYPH_HEIGHT / float(np.median(heights))
+        if scale >= 1.0:
+            return image
+        
+        size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+        return PIL.Image.fromarray(cv2.resize(pixels, size, interpolation=cv2.INTER_AREA))
     
     def extract_text_with_ocr(self, 
                              image: 'Image', 
@@ -251,23 +494,70 @@ class ScreenCapture:
             Extracted text string with filtered characters
         """
         if preprocess:
-            image = self.preprocess_image(image)
+            image = self.downscale_for_ocr(self.preprocess_image(image))
         
         try:
-            # Disable dictionaries and optimize for single letter recognition
-            # The game text is individual letters, not real words
-            config = '--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ load_system_dawg=false load_freq_dawg=false'
-            
-            text = pytesseract.image_to_string(image, config=config)
+            if self._api is not None:
+                self._api.SetImage(image)
+                text = self._api.GetUTF8Text()
+            else:
+                text = pytesseract.image_to_string(image, config=PYTESSERACT_CONFIG)
     
-            # Clean up the text - remove spaces, newlines, and non-alphabetic characters
-            cleaned_text = ''.join(char.upper() for char in text if char.isalpha())
-
-            return cleaned_text
+            return self._clean_ocr_text(text)
             
         except Exception as e:
             return ""
     
+    def extract_text_batch(self, 
+                           images: List['Image'], 
+                           preprocess: bool = True) -> List[str]:
+        """
+        Extract text from several images, paying OCR start-up cost once.
+        
+        With the persistent tesserocr engine each image is recognized in turn.
+        Otherwise the images are written to a temporary directory and handed to
+        a single tesseract run through a list file; its output has one page per
+        image, separated by form feeds.
+        
+        Args:
+            images: PIL Images to process
+            preprocess: Whether to preprocess images for better OCR
+            
+        Returns:
+            Filtered text for each image, in order
+        """
+        if self._api is not None or len(images) < 2:
+            return [self.extract_text_with_ocr(image, preprocess) for image in images]
+        
+        if preprocess:
+            images = [self.downscale_for_ocr(self.preprocess_image(image)) for image in images]
+        
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                paths = []
+                for i, image in enumerate(images):
+                    path = Path(tmp_dir) / f'capture_{i}.png'
+                    image.save(path)
+                    paths.append(str(path))
+                manifest = Path(tmp_dir) / 'images.txt'
+                manifest.write_text('\n'.join(paths) + '\n')
+                
+                text = pytesseract.image_to_string(str(manifest), config=PYTESSERACT_CONFIG)
+        except Exception as e:
+            return ["" for _ in images]
+        
+        pages = text.split('\f')
+        if len(pages) < len(images):
+            # Page boundaries were lost; fall back to one call per image
+            return [self.extract_text_with_ocr(image, preprocess=False) for image in images]
+        return [self._clean_ocr_text(page) for page in pages[:len(images)]]
+    
+    @staticmethod
+    def _clean_ocr_text(text: str) -> str:
+        """Remove spaces, newlines, and non-alphabetic characters, uppercasing the rest."""
+        # Single C-level pass; OCR is whitelisted to A-Z, so only ASCII letters matter
+        return text.encode('ascii', 'ignore').translate(_UPPER_TABLE, _NON_LETTERS).decode('ascii')
+    
     def find_letters_in_text(self, 
                            text: str, 
                            pattern_type: str = 'generic') -> List[str]:
@@ -281,7 +571,11 @@ class ScreenCapture:
         Returns:
             List of detected letters
         """
-        pattern = self.letter_patterns.get(pattern_type, self.letter_patterns['generic'])
+        if pattern_type not in self.letter_patterns or pattern_type == 'generic':
+            # Any ASCII letter, uppercased: same as the generic pattern without the regex
+            return list(self._clean_ocr_text(text))
+        
+        pattern = self.letter_patterns[pattern_type]
         letters = re.findall(pattern, text)
         return [letter.upper() for letter in letters]
     
@@ -291,7 +585,8 @@ class ScreenCapture:
                                  crop_to_center: bool = True,
                                  crop_width_percent: float = 0.26,
                                  crop_height_percent: float = 0.55,
-                                 crop_vertical_start: float = 0.35) -> List[str]:
+                                 crop_vertical_start: float = 0.35,
+                                 tile_rois: Optional[List[Tuple[int, int, int, int]]] = None) -> List[str]:
         """
         Main method to detect letters from screen.
         
@@ -302,26 +597,124 @@ class ScreenCapture:
             crop_width_percent: Width percentage to crop (0.26 = middle 26%)
             crop_height_percent: Height percentage to crop (0.55 = 55% height)
             crop_vertical_start: Vertical start position as percentage (0.35 = start at 35%)
+            tile_rois: Optional tile boxes (x, y, width, height) in the captured image;
+                with templates loaded, letters are read by template matching first
             
         Returns:
             List of detected letters
         """
-        # Capture image
+        image = self._capture_for_detection(window_title, crop_to_center, crop_width_percent,
+                                            crop_height_percent, crop_vertical_start)
+        if image is None:
+            return []
+        
+        if tile_rois:
+            letters = self.detect_letters_via_templates(image, tile_rois)
+            if letters is not None:
+                return letters
+        
+        return self._letters_from_image(image, preprocess)
+    
+    def detect_letters_from_screen_stream(self, 
+                                          n_frames: int,
+                                          interval: float = 0.0,
+                                          window_title: Optional[str] = None,
+                                          preprocess: bool = True,
+                                          crop_to_center: bool = True,
+                                          crop_width_percent: float = 0.26,
+                                          crop_height_percent: float = 0.55,
+                                          crop_vertical_start: float = 0.35) -> List[List[str]]:
+        """
+        Detect letters from several consecutive captures, overlapping capture and OCR.
+        
+        Each frame is captured on the calling thread (the screen grabber is not
+        shared across threads) while the previous frame is still being read by
+        OCR on a worker thread, which runs outside the GIL. At most one frame
+        is waiting on OCR at a time, so only two images are ever held.
+        
+        Args:
+            n_frames: Number of frames to capture
+            interval: Minimum seconds between the starts of successive captures
+            window_title: Specific window to capture (None for full screen)
+            preprocess: Whether to preprocess image for OCR
+            crop_to_center: Whether to crop to center region of window
+            crop_width_percent: Width percentage to crop (0.26 = middle 26%)
+            crop_height_percent: Height percentage to crop (0.55 = 55% height)
+            crop_vertical_start: Vertical start position as percentage (0.35 = start at 35%)
+            
+        Returns:
+            List of detected letters for each frame, in capture order
+        """
+        results: List[List[str]] = []
+        pending = None
+        start = time.monotonic()
+        
+        # One worker keeps OCR calls serialized, so the shared tesseract engine is never used concurrently
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for frame in range(n_frames):
+                # Wait out the interval while the previous frame is still in OCR
+                delay = start + frame * interval - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                
+                image = self._capture_for_detection(window_title, crop_to_center, crop_width_percent,
+                                                    crop_height_percent, crop_vertical_start)
+                
+                # Collect the previous frame only now, so its OCR overlapped this capture
+                if pending is not None:
+                    results.append(pending.result())
+                    pending = None
+                
+                if image is None:
+                    results.append([])
+                else:
+                    pending = executor.submit(self._letters_from_image, image, preprocess)
+            
+            if pending is not None:
+                results.append(pending.result())
+        
+        return results
+    
+    def _capture_for_detection(self, 
+                               window_title: Optional[str],
+                               crop_to_center: bool,
+                               crop_width_percent: float,
+                               crop_height_percent: float,
+                               crop_vertical_start: float) -> Optional['Image']:
+        """
+        Capture the image used for letter detection.
+        
+        Args:
+            window_title: Specific window to capture (None for full screen)
+            crop_to_center: Whether to crop to center region of window
+            crop_width_percent: Width percentage to crop
+            crop_height_percent: Height percentage to crop
+            crop_vertical_start: Vertical start position as percentage
+            
+        Returns:
+            PIL Image, or None if the window was not found
+        """
         if window_title:
-            image = self.capture_window_by_title(window_title, 'background', 3, False,
-                                               crop_to_center, crop_width_percent, crop_height_percent, crop_vertical_start)
-            if image is None:
-                return []
-        else:
-            image = self.capture_screen_region()
+            return self.capture_window_by_title(window_title, 'background', 3, False,
+                                                crop_to_center, crop_width_percent, crop_height_percent, crop_vertical_start)
+        return self.capture_screen_region()
+    
+    def _letters_from_image(self, image: 'Image', preprocess: bool) -> List[str]:
+        """
+        Run OCR on a captured image and pick out the letters.
         
+        Args:
+            image: PIL Image to process
+            preprocess: Whether to preprocess image for OCR
+            
+        Returns:
+            List of detected letters
+        """
         # Extract text using OCR
         text = self.extract_text_with_ocr(image, preprocess)
         
         # Find letters in the text
-        letters = self.find_letters_in_text(text, 'generic')
-        
-        return letters
+        return self.find_letters_in_text(text, 'generic')
     
     def save_debug_image(self, image: 'Image', filename: str = "debug_capture.png"):
         """Save captured image for debugging purposes."""
@@ -368,8 +761,12 @@ def list_available_windows() -> List[str]:
         print("Screen capture dependencies not installed.")
         return []
     
+    gw = _get_pygetwindow()
+    if gw is None:
+        print("Window listing requires pygetwindow on a supported platform.")
+        return []
+    
     try:
-        import pygetwindow as gw
         titles = gw.getAllTitles()
         # Filter out empty titles and system windows
         filtered_titles = [title for title in titles if title.strip() and not title.startswith('_')]
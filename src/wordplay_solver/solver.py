@@ -1,9 +1,51 @@
 """Solver module for finding the highest scoring word."""
-from typing import Dict, List, Optional, Tuple
-from collections import Counter
+import heapq
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
 
-from wordplay_solver.dictionary import Dictionary
-from wordplay_solver.scoring import calculate_word_score, parse_letter_input
+from wordplay_solver.dictionary import ALPHABET, Dictionary
+from wordplay_solver.scoring import LENGTH_BONUSES, STANDARD_LETTER_VALUES, parse_letter_input
+
+# Optional NumPy support for vectorized scoring over the dictionary index
+try:
+    import numpy as np
+    from wordplay_solver._kernels import best_candidate, warm_up
+    _LENGTH_BONUS_ARRAY = np.array(LENGTH_BONUSES, dtype=np.int64)
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Magnitude below which value-vector scoring (and its tie-break key) cannot overflow int64
+_INT64_SAFE_LIMIT = 1 << 60
+
+# Number of distinct custom letter-value sets whose value vectors are kept per solver
+VALUES_CACHE_SIZE = 32
+
+# Number of recent queries whose results are memoized per solver; full word lists are larger
+BEST_CACHE_SIZE = 1024
+ALL_CACHE_SIZE = 64
+
+def _top_positions(key: 'np.ndarray', n: int) -> 'np.ndarray':
+    """
+    Positions of the n largest keys, largest first, without sorting the whole array.
+    
+    Ties go to the earlier position, matching a stable descending sort.
+    
+    Args:
+        key: 1-D array of sort keys
+        n: Number of positions to return
+        
+    Returns:
+        Array of up to n positions into key
+    """
+    if len(key) > n:
+        cut = np.partition(key, len(key) - n)[len(key) - n]
+        above = np.flatnonzero(key > cut)
+        chosen = np.concatenate((above, np.flatnonzero(key == cut)[:n - len(above)]))
+    else:
+        chosen = np.arange(len(key))
+    return chosen[np.lexsort((chosen, -key[chosen]))]
 
 class WordSolver:
     """Solver for finding the highest scoring word from given letters."""
@@ -16,6 +58,21 @@ class WordSolver:
             dict_path: Optional path to custom dictionary file
         """
         self.dictionary = Dictionary(dict_path)
+        
+        # Value vectors are rebuilt only when inline or config values change them
+        self._values_for = lru_cache(maxsize=VALUES_CACHE_SIZE)(self._build_values)
+        self._default_values = self._build_values(tuple(STANDARD_LETTER_VALUES.items()))
+        
+        # Repeat racks (e.g. polling the same board) return straight from the memo
+        self._best_for = lru_cache(maxsize=BEST_CACHE_SIZE)(self._solve_best)
+        self._all_for = lru_cache(maxsize=ALL_CACHE_SIZE)(self._solve_all)
+        
+        # Best result of each recently listed query, so a follow-up find_best_word doesn't re-score
+        self._listed_best: Dict[Tuple[str, Optional[Tuple[Tuple[str, int], ...]]], Tuple[str, int]] = {}
+        
+        # Pay any JIT compile cost up front rather than on the first query
+        if self.dictionary.counts is not None:
+            warm_up()
     
     def find_best_word(self, letters: str, custom_values: Optional[Dict[str, int]] = None) -> Tuple[str, int]:
         """
@@ -28,66 +85,252 @@ class WordSolver:
         Returns:
             Tuple of (best_word, score)
         """
-        # Parse any inline custom values (e.g., 'a1b3')
-        inline_values = parse_letter_input(letters)
+        return self._best_for(*self._query_key(letters, custom_values))
+    
+    def find_all_words_with_scores(self, letters: str, custom_values: Optional[Dict[str, int]] = None) -> List[Tuple[str, int, int]]:
+        """
+        Find all valid words with their scores and lengths.
         
-        # Combine with config file values (config values take precedence)
-        if custom_values:
-            letter_values = {**inline_values, **custom_values}
-        else:
-            letter_values = inline_values
+        Args:
+            letters: String of available letters (can include custom values, e.g., 'a1b3')
+            custom_values: Optional custom letter values from config file
+            
+        Returns:
+            List of tuples (word, score, length) sorted by score descending
+        """
+        # Copy so callers can't mutate the memoized result
+        return list(self._all_for(*self._query_key(letters, custom_values)))
+    
+    def find_top_words_with_scores(self, letters: str, custom_values: Optional[Dict[str, int]] = None,
+                                   n: int = 5) -> List[Tuple[str, int, int]]:
+        """
+        Find the n highest scoring words without sorting the full listing.
         
-        # Get all valid words that can be formed from the letters
-        valid_words = self.dictionary.get_words_with_letters(''.join(letter_values.keys()))
+        Gives the same words, in the same order, as the first n entries of
+        find_all_words_with_scores.
         
-        if not valid_words:
-            return "", 0
+        Args:
+            letters: String of available letters (can include custom values, e.g., 'a1b3')
+            custom_values: Optional custom letter values from config file
+            n: Number of words to return
+            
+        Returns:
+            List of up to n tuples (word, score, length) sorted by score descending
+        """
+        if n <= 0:
+            return []
         
-        # Calculate score for each word and find the best one
-        best_word = ""
-        best_score = -1
+        rack, values = self._resolve_values(letters, custom_values)
         
-        for word in valid_words:
-            score = calculate_word_score(word, letter_values)
-            if score > best_score or (score == best_score and len(word) > len(best_word)):
-                best_word = word
-                best_score = score
+        if not isinstance(values, list):
+            indices, scores, lengths = self._score_vectorized(rack, values)
+            if not len(indices):
+                return []
+            # One combined key, so length breaks score ties
+            key = scores.astype(np.int64) * (int(lengths.max()) + 1) + lengths
+            top = _top_positions(key, n)
+            return self._rows_to_tuples(indices[top], scores[top], lengths[top])
         
-        return best_word, best_score
+        # Full-listing order is score, then length, descending, with alphabetical ties
+        word_scores = self.dictionary.get_scored_words_with_letters(rack, values)
+        return heapq.nsmallest(n, word_scores, key=lambda x: (-x[1], -x[2], x[0]))
     
-    def find_all_words_with_scores(self, letters: str, custom_values: Optional[Dict[str, int]] = None) -> List[Tuple[str, int, int]]:
+    def find_top_words_by_length(self, letters: str, custom_values: Optional[Dict[str, int]] = None,
+                                 n: int = 5) -> Dict[int, List[Tuple[str, int, int]]]:
         """
-        Find all valid words with their scores and lengths.
+        Find the n highest scoring words of each length.
+        
+        Each bucket matches the first n words of that length in
+        find_all_words_with_scores, in the same order.
         
         Args:
             letters: String of available letters (can include custom values, e.g., 'a1b3')
             custom_values: Optional custom letter values from config file
+            n: Number of words to keep per length
             
         Returns:
-            List of tuples (word, score, length) sorted by score descending
+            Dictionary mapping word length to up to n (word, score, length) tuples
+        """
+        if n <= 0:
+            return {}
+        
+        rack, values = self._resolve_values(letters, custom_values)
+        
+        if not isinstance(values, list):
+            indices, scores, lengths = self._score_vectorized(rack, values)
+            if not len(indices):
+                return {}
+            
+            # word_list is sorted by length, so each length is one contiguous run of matches
+            buckets = {}
+            bounds = np.flatnonzero(np.diff(lengths)) + 1
+            for start, stop in zip([0, *bounds.tolist()], [*bounds.tolist(), len(lengths)]):
+                top = start + _top_positions(scores[start:stop], n)
+                buckets[int(lengths[start])] = self._rows_to_tuples(indices[top], scores[top], lengths[top])
+            return buckets
+        
+        by_length: Dict[int, List[Tuple[str, int, int]]] = defaultdict(list)
+        for entry in self.dictionary.get_scored_words_with_letters(rack, values):
+            by_length[entry[2]].append(entry)
+        return {length: heapq.nsmallest(n, bucket, key=lambda x: (-x[1], x[0]))
+                for length, bucket in by_length.items()}
+    
+    def _rows_to_tuples(self, indices: 'np.ndarray', scores: 'np.ndarray',
+                        lengths: 'np.ndarray') -> List[Tuple[str, int, int]]:
+        """Convert parallel result arrays to (word, score, length) tuples."""
+        word_list = self.dictionary.word_list
+        # Convert whole columns with tolist() rather than boxing element by element
+        words = [word_list[i] for i in indices.tolist()]
+        return list(zip(words, scores.tolist(), lengths.tolist()))
+    
+    @staticmethod
+    def _query_key(letters: str, custom_values: Optional[Dict[str, int]]) -> Tuple[str, Optional[Tuple[Tuple[str, int], ...]]]:
+        """
+        Build a hashable memo key for a query.
+        
+        Args:
+            letters: String of available letters (can include custom values, e.g., 'a1b3')
+            custom_values: Optional custom letter values from config file
+            
+        Returns:
+            Tuple of (letters, sorted custom value pairs or None)
+        """
+        # Results don't depend on rack order, but inline values must stay next to their letters
+        if letters.isalpha():
+            letters = ''.join(sorted(letters.lower()))
+        return letters, tuple(sorted(custom_values.items())) if custom_values else None
+    
+    def _solve_best(self, letters: str, custom_items: Optional[Tuple[Tuple[str, int], ...]]) -> Tuple[str, int]:
+        """
+        Uncached body of find_best_word.
+        
+        Args:
+            letters: String of available letters (can include custom values, e.g., 'a1b3')
+            custom_items: Sorted custom letter-value pairs, or None
+            
+        Returns:
+            Tuple of (best_word, score)
+        """
+        # Full listings are sorted best-first with the same tie-break, so their head is the answer
+        listed = self._listed_best.get((letters, custom_items))
+        if listed is not None:
+            return listed
+        
+        rack, values = self._resolve_values(letters, dict(custom_items) if custom_items else None)
+        
+        counts, lengths = self.dictionary.counts, self.dictionary.lengths
+        if counts is not None and lengths is not None and not isinstance(values, list):
+            indices = self.dictionary.find_word_indices(rack)
+            best, score = best_candidate(counts, indices, values, lengths, _LENGTH_BONUS_ARRAY)
+            if best < 0:
+                return "", 0
+            return self.dictionary.word_list[indices[best]], score
+        
+        # Branch-and-bound over the word graph; no need to enumerate every word
+        return self.dictionary.find_best_scoring_word(rack, values)
+    
+    def _solve_all(self, letters: str, custom_items: Optional[Tuple[Tuple[str, int], ...]]) -> Tuple[Tuple[str, int, int], ...]:
+        """
+        Uncached body of find_all_words_with_scores.
+        
+        Args:
+            letters: String of available letters (can include custom values, e.g., 'a1b3')
+            custom_items: Sorted custom letter-value pairs, or None
+            
+        Returns:
+            Tuple of (word, score, length) tuples sorted by score descending
+        """
+        rack, values = self._resolve_values(letters, dict(custom_items) if custom_items else None)
+        
+        if not isinstance(values, list):
+            indices, scores, lengths = self._score_vectorized(rack, values)
+            word_list = self.dictionary.word_list
+            order = np.lexsort((-lengths, -scores))
+            # Convert whole columns with tolist() rather than boxing element by element
+            words = [word_list[i] for i in indices[order].tolist()]
+            word_scores = tuple(zip(words, scores[order].tolist(), lengths[order].tolist()))
+        else:
+            # Get all valid words already scored by the graph walk
+            scored = self.dictionary.get_scored_words_with_letters(rack, values)
+            
+            # Sort by score descending, then by length descending for ties
+            scored.sort(key=lambda x: (-x[1], -x[2]))
+            word_scores = tuple(scored)
+        
+        if len(self._listed_best) >= ALL_CACHE_SIZE:
+            # Drop the oldest entry; insertion order makes this FIFO
+            del self._listed_best[next(iter(self._listed_best))]
+        self._listed_best[(letters, custom_items)] = word_scores[0][:2] if word_scores else ("", 0)
+        
+        return word_scores
+    
+    def _resolve_values(self, letters: str, custom_values: Optional[Dict[str, int]]) -> Tuple[str, Any]:
+        """
+        Work out the rack and per-letter value vector for a query.
+        
+        Args:
+            letters: String of available letters (can include custom values, e.g., 'a1b3')
+            custom_values: Optional custom letter values from config file
+            
+        Returns:
+            Tuple of (rack letters, 26-slot value vector indexed by letter)
         """
         # Parse any inline custom values (e.g., 'a1b3')
         inline_values = parse_letter_input(letters)
+        rack = ''.join(inline_values.keys())
+        
+        # Plain racks score with standard values, so the default vector applies as is
+        if not custom_values and letters.isalpha():
+            return rack, self._default_values
         
         # Combine with config file values (config values take precedence)
         if custom_values:
             letter_values = {**inline_values, **custom_values}
+            rack = ''.join(letter_values.keys())
         else:
             letter_values = inline_values
+        return rack, self._values_for(tuple(sorted(letter_values.items())))
+    
+    def _build_values(self, items: Tuple[Tuple[str, int], ...]) -> Any:
+        """
+        Build the 26-slot value vector for a set of letter values.
         
-        # Get all valid words that can be formed from the letters
-        valid_words = self.dictionary.get_words_with_letters(''.join(letter_values.keys()))
-        
-        if not valid_words:
-            return []
+        Args:
+            items: Sorted (letter, value) pairs
+            
+        Returns:
+            Value vector as an int64 array for the NumPy path, or a list when
+            NumPy is unavailable or the values are too large to score exactly in int64
+        """
+        letter_values = dict(items)
+        values = [letter_values.get(char, 0) for char in ALPHABET]
+        if self.dictionary.counts is None:
+            return values
         
-        # Calculate score for each word
-        word_scores = []
-        for word in valid_words:
-            score = calculate_word_score(word, letter_values)
-            word_scores.append((word, score, len(word)))
+        # Scores are at most max|value| * length plus a bonus, and the tie-break key
+        # multiplies them by length + 1; past this bound fall back to Python ints
+        span = self.dictionary.max_length + 1
+        if max(map(abs, values)) * span * span >= _INT64_SAFE_LIMIT:
+            return values
+        return np.array(values, dtype=np.int64)
+    
+    def _score_vectorized(self, letters: str, values: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """
+        Find and score all valid words at once using the dictionary's letter-count matrix.
         
-        # Sort by score descending, then by length descending for ties
-        word_scores.sort(key=lambda x: (-x[1], -x[2]))
+        Args:
+            letters: String of available letters
+            values: Per-letter values as an int64 array
+            
+        Returns:
+            Tuple of (indices into word_list, scores, lengths) as parallel arrays
+        """
+        counts, all_lengths = self.dictionary.counts, self.dictionary.lengths
+        if counts is None or all_lengths is None:
+            raise ImportError("NumPy is required for vectorized scoring. Install with: pip install numpy")
         
-        return word_scores
+        indices = self.dictionary.find_word_indices(letters)
+        lengths = all_lengths[indices]
+        scores = counts[indices].astype(np.int64) @ values
+        scores += _LENGTH_BONUS_ARRAY[np.minimum(lengths, 20)]
+        return indices, scores, lengths
@@ -0,0 +1,11 @@
+"""Shared pytest fixtures."""
+import pytest
+
+from wordplay_solver import dictionary
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep trie caches and shared indexes out of the user's home directory."""
+    monkeypatch.setattr(dictionary, 'CACHE_DIR', tmp_path / 'cache')
+    monkeypatch.setattr(dictionary, '_DICT_CACHE', {})
@@ -0,0 +1,143 @@
+"""Tests for the dictionary word graph, scoring walks and trie cache."""
+import os
+import random
+from collections import Counter
+
+import pytest
+
+from wordplay_solver import dictionary
+from wordplay_solver.dictionary import ALPHABET, Dictionary
+from wordplay_solver.scoring import calculate_word_score
+
+WORDS = [
+    'a', 'ab', 'aba', 'abandon', 'abase', 'abate', 'able', 'about', 'above',
+    'ace', 'aced', 'acre', 'act', 'acted', 'bad', 'bade', 'bake', 'baked',
+    'banana', 'band', 'bandana', 'bead', 'bean', 'beard', 'bed', 'bee',
+    'cab', 'cabbed', 'cable', 'cad', 'cade', 'cake', 'caked', 'can', 'cane',
+    'caned', 'cannon', 'dab', 'dance', 'danced', 'dean', 'deb', 'decade',
+    'ebb', 'ended', 'enhance', 'need', 'nodded', 'note', 'noted', 'one',
+    'onto', 'tab', 'table', 'tabled', 'tea', 'tee', 'ten', 'toe', 'ton',
+    'zebra', 'zed',
+]
+
+
+@pytest.fixture
+def dict_file(tmp_path):
+    path = tmp_path / 'words.txt'
+    path.write_text('\n'.join(word.upper() for word in WORDS) + '\n')
+    return path
+
+
+def formable(word, rack):
+    needed = Counter(word)
+    have = Counter(rack)
+    return all(have[letter] >= count for letter, count in needed.items())
+
+
+def test_best_scoring_word_matches_brute_force(dict_file):
+    dictionary_ = Dictionary(dict_file)
+    rng = random.Random(1234)
+    for _ in range(300):
+        rack = ''.join(rng.choice('abcdenotz') for _ in range(rng.randint(1, 9)))
+        values = [rng.randint(-5, 12) for _ in ALPHABET]
+        letter_values = dict(zip(ALPHABET, values))
+
+        candidates = [word for word in WORDS if formable(word, rack)]
+        word, score = dictionary_.find_best_scoring_word(rack, values)
+
+        if not candidates:
+            assert (word, score) == ("", 0)
+            continue
+        expected = max((calculate_word_score(w, letter_values), len(w)) for w in candidates)
+        assert word in candidates
+        assert (score, len(word)) == expected
+        assert calculate_word_score(word, letter_values) == score
+
+
+def test_scored_words_match_calculate_word_score(dict_file):
+    dictionary_ = Dictionary(dict_file)
+    rng = random.Random(99)
+    for rack in ('abandon', 'cabbed', 'zebra', 'dancetoe', 'q'):
+        values = [rng.randint(-5, 12) for _ in ALPHABET]
+        letter_values = dict(zip(ALPHABET, values))
+
+        scored = dictionary_.get_scored_words_with_letters(rack, values)
+
+        expected = {word for word in WORDS if formable(word, rack)}
+        assert {word for word, _, _ in scored} == expected
+        assert len(scored) == len(expected)
+        for word, score, length in scored:
+            assert score == calculate_word_score(word, letter_values)
+            assert length == len(word)
+
+
+def test_cache_is_written_and_reused(dict_file):
+    Dictionary(dict_file)
+    assert list(dictionary.CACHE_DIR.glob('*' + dictionary.CACHE_SUFFIX))
+
+    dictionary._DICT_CACHE.clear()
+    reloaded = Dictionary(dict_file)
+    assert reloaded.words == set(WORDS)
+
+
+def test_cache_rebuilt_when_size_changes(dict_file):
+    assert not Dictionary(dict_file).is_valid_word('zoned')
+
+    with open(dict_file, 'a') as f:
+        f.write('ZONED\n')
+
+    assert Dictionary(dict_file).is_valid_word('zoned')
+    dictionary._DICT_CACHE.clear()
+    assert Dictionary(dict_file).is_valid_word('zoned')
+
+
+def test_cache_rebuilt_when_mtime_changes(dict_file):
+    assert Dictionary(dict_file).is_valid_word('zebra')
+    stat = dict_file.stat()
+
+    # Same length replacement, so only the modification time tells them apart
+    dict_file.write_text(dict_file.read_text().replace('ZEBRA', 'ZEBUS'))
+    os.utime(dict_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert dict_file.stat().st_size == stat.st_size
+
+    dictionary._DICT_CACHE.clear()
+    rebuilt = Dictionary(dict_file)
+    assert rebuilt.is_valid_word('zebus')
+    assert not rebuilt.is_valid_word('zebra')
+
+
+def test_malformed_cache_is_a_miss(dict_file):
+    Dictionary(dict_file)
+    for cache_file in dictionary.CACHE_DIR.glob('*' + dictionary.CACHE_SUFFIX):
+        cache_file.write_bytes(b'not a pickle')
+
+    dictionary._DICT_CACHE.clear()
+    assert Dictionary(dict_file).words == set(WORDS)
+
+
+def test_missing_home_directory_skips_the_cache(dict_file, monkeypatch):
+    def no_home():
+        raise RuntimeError('Could not determine home directory.')
+
+    monkeypatch.setattr(dictionary, 'CACHE_DIR', None)
+    monkeypatch.setattr(dictionary.Path, 'home', no_home)
+
+    assert Dictionary(dict_file).words == set(WORDS)
+
+
+def test_failed_cache_write_leaves_no_temp_file(dict_file, monkeypatch):
+    def disk_full(*args, **kwargs):
+        raise OSError(28, 'No space left on device')
+
+    monkeypatch.setattr(dictionary.pickle, 'dump', disk_full)
+
+    assert Dictionary(dict_file).words == set(WORDS)
+    assert list(dictionary.CACHE_DIR.iterdir()) == []
+
+
+def test_missing_dictionary_raises_runtime_error(dict_file):
+    with pytest.raises(RuntimeError, match='not found'):
+        Dictionary(dict_file.parent / 'missing.txt')
+    # A path running through a regular file fails with NotADirectoryError
+    with pytest.raises(RuntimeError, match='not found'):
+        Dictionary(dict_file / 'words.txt')
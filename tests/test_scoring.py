@@ -0,0 +1,60 @@
+"""Tests for letter-value config parsing."""
+from pathlib import Path
+
+from wordplay_solver.scoring import STANDARD_LETTER_VALUES, get_letter_values
+
+EXAMPLE_CONFIG = Path(__file__).resolve().parent.parent / 'example_config.ini'
+
+
+def write_config(tmp_path, text):
+    path = tmp_path / 'config.ini'
+    path.write_text(text)
+    return str(path)
+
+
+def with_overrides(**overrides):
+    values = STANDARD_LETTER_VALUES.copy()
+    values.update(overrides)
+    return values
+
+
+def test_no_config_gives_standard_values():
+    assert get_letter_values() == STANDARD_LETTER_VALUES
+    assert get_letter_values('/nonexistent/config.ini') == STANDARD_LETTER_VALUES
+
+
+def test_shipped_example_config_only_has_comments():
+    assert get_letter_values(str(EXAMPLE_CONFIG)) == STANDARD_LETTER_VALUES
+
+
+def test_plain_and_indented_keys(tmp_path):
+    config = write_config(tmp_path, '[letter_values]\na = 2\nQ: 8\n  e = 5\n\tb=7\n')
+    assert get_letter_values(config) == with_overrides(a=2, q=8, e=5, b=7)
+
+
+def test_comments_and_invalid_values_are_skipped(tmp_path):
+    config = write_config(tmp_path, (
+        '[letter_values]\n'
+        '; a = 9\n'
+        '# e = 9\n'
+        'b = three\n'
+        'c = 4 ; inline comments are not stripped\n'
+        'ab = 6\n'
+        'd = -2\n'
+        'z = 10\n'
+    ))
+    assert get_letter_values(config) == with_overrides(d=-2, z=10)
+
+
+def test_only_the_letter_values_section_is_read(tmp_path):
+    config = write_config(tmp_path, (
+        '[DEFAULT]\n'
+        'x = 1\n'
+        '[other]\n'
+        'a = 9\n'
+        '[letter_values]\n'
+        'a = 3\n'
+        '[more]\n'
+        'e = 9\n'
+    ))
+    assert get_letter_values(config) == with_overrides(a=3)
@@ -0,0 +1,75 @@
+"""Tests for the solver's top-N listings, memoization and exact scoring."""
+import pytest
+
+from wordplay_solver.scoring import calculate_word_score, parse_letter_input
+from wordplay_solver.solver import WordSolver
+
+WORDS = [
+    'a', 'ab', 'abed', 'able', 'ace', 'aced', 'acre', 'act', 'bad', 'bade',
+    'bead', 'bear', 'beard', 'bed', 'bread', 'cab', 'cad', 'cade', 'care',
+    'cared', 'cedar', 'crab', 'dab', 'dace', 'dare', 'dear', 'deb', 'ear',
+    'era', 'race', 'raced', 'read', 'red', 'tab', 'tea', 'trace', 'traced',
+]
+
+RACKS = ['abcdert', 'cedarbt', 'ab', 'xyz', 'a3b1c5d2e1', 'ttraaced']
+
+
+@pytest.fixture
+def solver(tmp_path):
+    path = tmp_path / 'words.txt'
+    path.write_text('\n'.join(WORDS) + '\n')
+    return WordSolver(str(path))
+
+
+@pytest.mark.parametrize('custom_values', [None, {'a': 4, 'e': -2, 'r': 0}])
+def test_top_listings_are_slices_of_the_full_listing(solver, custom_values):
+    for rack in RACKS:
+        full = solver.find_all_words_with_scores(rack, custom_values)
+
+        for n in (1, 3, 5, 50):
+            assert solver.find_top_words_with_scores(rack, custom_values, n) == full[:n]
+
+            by_length = solver.find_top_words_by_length(rack, custom_values, n)
+            assert set(by_length) == {length for _, _, length in full}
+            for length, bucket in by_length.items():
+                assert bucket == [entry for entry in full if entry[2] == length][:n]
+
+        assert solver.find_top_words_with_scores(rack, custom_values, 0) == []
+        assert solver.find_top_words_by_length(rack, custom_values, 0) == {}
+
+
+def test_anagrammed_rack_hits_the_memo(solver):
+    best = solver.find_best_word('traced')
+    assert solver.find_best_word('DECART') == best
+    assert solver._best_for.cache_info().hits == 1
+
+    full = solver.find_all_words_with_scores('bread')
+    assert solver.find_all_words_with_scores('debar') == full
+    assert solver._all_for.cache_info().hits == 1
+
+
+def test_best_word_reuses_a_listed_result(solver, monkeypatch):
+    full = solver.find_all_words_with_scores('cedarbt')
+
+    def no_search(*args, **kwargs):
+        raise AssertionError('best word should come from the listing')
+
+    monkeypatch.setattr(solver.dictionary, 'find_best_scoring_word', no_search)
+    monkeypatch.setattr(solver.dictionary, 'find_word_indices', no_search)
+    assert solver.find_best_word('tbradec') == full[0][:2]
+
+
+def test_huge_custom_values_score_exactly(solver):
+    # Several of these letters overflow int64, so scoring must fall back to Python ints
+    custom_values = {'a': 7 * 10**18 + 1, 'c': 10**18, 'e': -(10**18) - 7, 'r': 2 * 10**18 + 3}
+    letter_values = {**parse_letter_input('abcdert'), **custom_values}
+
+    full = solver.find_all_words_with_scores('abcdert', custom_values)
+    assert full
+    for word, score, length in full:
+        assert score == calculate_word_score(word, letter_values)
+        assert length == len(word)
+    assert full[0][1] > 2**63
+
+    assert solver.find_best_word('abcdert', custom_values) == full[0][:2]
+    assert solver.find_top_words_with_scores('abcdert', custom_values, 5) == full[:5]